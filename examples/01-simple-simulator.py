@@ -161,6 +161,13 @@ model.set_sequence(flip=flip, TR=10.0)
 #
 # By contrast, ``sequence`` parameters will not be broadcasted, and are shared amongst all the atoms.
 #
+# If the engine only contains elementwise operations (e.g., closed-form steady-state signals), the class attribute
+# ``use_vmap`` can be set to ``False``: the engine is then called once for the whole batch, with ``properties`` of shape
+# ``(nbatches, 1, ...)`` broadcasting against ``sequence`` parameters.
+#
+# The engine can return either a complex tensor or a ``(real, imag)`` tuple of real tensors. The latter avoids
+# complex arithmetic (and complex autodifferentiation) inside the engine; the complex signal is assembled by the base class.
+#
 # Running the simulation
 # ----------------------
 # After object instantiation and definition of object and sequence parameters, simulation can be executed by
@@ -5,24 +5,36 @@ __all__ = ["AbstractModel"]
 import inspect
 
 from abc import ABC, abstractmethod
-from typing import Any, Callable
-from types import SimpleNamespace
+from collections import ChainMap
+from functools import lru_cache, partial, wraps
+from typing import Any, Callable, Literal
+from types import FunctionType, SimpleNamespace
 
 import torch
 
 from mrinufft._array_compat import _get_leading_argument, _get_device
 
-from .decorators import autocast, broadcast, jacfwd
+from .decorators import autocast, broadcast, jacfwd, jacrev, not_implemented
 
 
 class AbstractModel(ABC):
     """Abstract base class for MRI simulation models with automated parameter handling."""
 
+    # Set to ``False`` in subclasses whose ``_engine`` is purely elementwise,
+    # i.e., it natively broadcasts broadcastable parameters of shape ``(N, 1, ...)``
+    # against the sequence parameters. Forward computation then calls ``_engine``
+    # on the whole batch (or on ``chunk_size`` slices of it) instead of vectorizing
+    # it with ``torch.vmap``.
+    # Keep ``True`` for engines with data-dependent control flow (e.g., EPG loops).
+    use_vmap: bool = True
+
     def __init__(
         self,
         diff: str | tuple[str] | None = None,
         chunk_size: int | None = None,
         device: str | torch.device | None = None,
+        compile: bool = False,
+        jac_mode: Literal["auto", "fwd", "rev"] = "auto",
         *args,
         **kwargs,
     ):
@@ -37,19 +49,57 @@ class AbstractModel(ABC):
             Device for computations (e.g., 'cpu', 'cuda').
         chunk_size : int | None, optional
             Number of samples to process in parallel.
+        compile : bool, optional
+            Compile forward engine using ``torch.compile``.
+            This applies to forward-only calls and to the forward output
+            of models with a manual ``_jacobian_engine``; forward output and
+            Jacobian computed by automatic differentiation are never compiled.
+            The default is ``False``.
+        jac_mode : Literal["auto", "fwd", "rev"], optional
+            Automatic differentiation mode for the Jacobian computation.
+            If ``"auto"``, use forward-mode when the number of differentiated inputs
+            does not exceed the number of outputs, and reverse-mode otherwise.
+            The default is ``"auto"``.
 
         """
+        if jac_mode != "auto" and jac_mode not in _JAC_MODES:
+            raise ValueError(
+                f"Unsupported jac_mode: {jac_mode} - must be one of 'auto', 'fwd', 'rev'"
+            )
+
         self.chunk_size = chunk_size
         self.device = device
         self.diff = diff
+        self.compile = compile
+        self.jac_mode = jac_mode
+        self._call_cache = {}
 
         # Extract broadcastable parameters
         self.broadcastable_params = list(
             inspect.signature(self.set_properties).parameters.keys()
         )
+        self._broadcastable_set = frozenset(self.broadcastable_params)
+        self._argmap = {name: n for n, name in enumerate(self.broadcastable_params)}
+
+        # All broadcastable parameters are vectorized along their leading axis
+        self._in_dims = (0,) * len(self.broadcastable_params)
         self.properties = SimpleNamespace()
         self.sequence = SimpleNamespace()
 
+        # Parameters split into broadcastable and non-broadcastable groups,
+        # updated by ``set_properties`` and ``set_sequence``
+        self._broadcastable_kwargs = {}
+        self._non_broadcastable_kwargs = {}
+        self._split_state = self._get_split_state()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Split parameters once when they are set rather than on every call
+        for name in ("set_properties", "set_sequence"):
+            if name in cls.__dict__:
+                setattr(cls, name, _split_after(cls.__dict__[name]))
+
     @autocast
     @abstractmethod
     def set_properties(self, *args, **kwargs):
@@ -75,12 +125,63 @@ class AbstractModel(ABC):
         raise NotImplementedError("Subclasses must implement `_engine`.")
 
     @staticmethod
+    @not_implemented
     def _jacobian_engine(*args, **kwargs):
         """
         Manual Jacobian engine.
         """
         raise NotImplementedError("Manual derivative not implemented.")
 
+    def _get_split_state(self) -> tuple:
+        """
+        Get device and parameter objects the parameter split depends on.
+        """
+        return (
+            self.device,
+            *vars(self.properties).items(),
+            *vars(self.sequence).items(),
+        )
+
+    def _update_split(self):
+        """
+        Split parameters again if device or parameters were changed outside ``set_properties`` / ``set_sequence``.
+        """
+        if not _is_same_state(self._get_split_state(), self._split_state):
+            self._split_kwargs()
+
+    def _split_kwargs(self):
+        """
+        Move parameters to computational device and split them into broadcastable and non-broadcastable groups.
+        """
+        kwargs = {**vars(self.properties), **vars(self.sequence)}
+        self._split_state = self._get_split_state()
+
+        # Invalidate callables built from previous parameters
+        self._call_cache.clear()
+
+        # Get device
+        if self.device is None:
+            # get device from first positional or keyworded argument
+            leading_arg = _get_leading_argument([], kwargs)
+
+            # get array module from leading argument
+            device = _get_device(leading_arg)
+        else:
+            device = self.device
+
+        # Force device
+        for k in kwargs.keys():
+            if isinstance(kwargs[k], torch.Tensor):
+                kwargs[k] = kwargs[k].to(device)
+
+        # Split broadcastable and non-broadcastable params
+        self._broadcastable_kwargs = {
+            k: v for k, v in kwargs.items() if k in self._broadcastable_set
+        }
+        self._non_broadcastable_kwargs = {
+            k: v for k, v in kwargs.items() if k not in self._broadcastable_set
+        }
+
     def _get_func(self, _func, *args, **kwargs) -> tuple[Callable, dict[str, Any]]:
         """
         Dynamically split parameters into broadcastable and non-broadcastable groups.
@@ -102,47 +203,131 @@ class AbstractModel(ABC):
             Captured non-broadcastable parameters.
 
         """
-        # Get the engine's signature
-        signature = inspect.signature(_func)
-
-        # Extract default values for all parameters
-        default_args = {}
-        for k, v in signature.parameters.items():
-            if v.default is not inspect.Parameter.empty:
-                default_args[k] = v.default
-            else:
-                default_args[k] = None
+        # Get the engine's (cached) parameter names and default values
+        parameter_names, default_args = _get_signature_info(_func)
 
         # Merge default values and user-provided keyword arguments
         merged_kwargs = {**default_args, **kwargs}
 
         # Replace first `len(user_args)` items with positional arguments
-        parameter_names = list(signature.parameters.keys())
-        for idx, arg in enumerate(args):
-            merged_kwargs[parameter_names[idx]] = arg
+        merged_kwargs.update(zip(parameter_names, args))
 
         # Split into broadcastable and non-broadcastable
         non_broadcastable_args = {
-            k: v for k, v in merged_kwargs.items() if k not in self.broadcastable_params
+            k: v for k, v in merged_kwargs.items() if k not in self._broadcastable_set
         }
 
+        # Bind non-broadcastable parameters once
+        bound_func = partial(_func, **non_broadcastable_args)
+        broadcastable_params = tuple(self.broadcastable_params)
+
         # Define a new engine that takes only broadcastable parameters explicitly
         def func(*args):
             # Map provided positional arguments to broadcastable parameter names
-            broadcastable_mapping = dict(zip(self.broadcastable_params, args))
-            # Merge broadcastable and non-broadcastable parameters
-            combined_args = {**broadcastable_mapping, **non_broadcastable_args}
-            # Call the original engine
-            return _func(**combined_args)
+            return bound_func(**dict(zip(broadcastable_params, args)))
 
         # Get argnums for diff
         if self.diff is not None:
-            argnums = _get_argnums(self.diff, self.broadcastable_params)
+            argnums = _get_argnums(self.diff, self._argmap)
         else:
             argnums = None
 
         return func, argnums
 
+    def _get_forward_engine(self, engine: Callable, *args, **kwargs) -> Callable:
+        """
+        Return the batched forward engine, before output reshaping.
+
+        Parameters
+        ----------
+        engine : Callable
+            Prebuilt engine accepting broadcastable parameters, as returned by ``_get_func``.
+        *args : Any
+            Positional arguments for the simulation.
+        **kwargs : Any
+            Keyword arguments for the simulation.
+
+        Returns
+        -------
+        callable
+            A function that evaluates the forward model on batched inputs.
+
+        """
+        if self.use_vmap:
+            batched = torch.func.vmap(engine, in_dims=self._in_dims)
+        else:
+            batched = _expand_dims(engine, _get_max_ndim(kwargs.values()))
+
+        # Compile once: dynamo guards handle changes in input shape, dtype and device.
+        # Chunking stays outside the compiled function, so only chunk shapes are traced
+        if self.compile:
+            batched = torch.compile(batched, mode="reduce-overhead")
+
+        # Assemble complex output of (real, imag) engines for each chunk,
+        # so that only the complex output is preallocated for the whole batch
+        return _chunk(_complex_output(batched), self.chunk_size)
+
+    def _compute(self, has_jac: bool, *args, **kwargs) -> Callable:
+        """
+        Return a callable for forward and, optionally, Jacobian computation.
+
+        When the Jacobian is computed by automatic differentiation,
+        the forward output is obtained from the same pass.
+
+        Parameters
+        ----------
+        has_jac : bool
+            If ``True``, the callable returns both forward output and Jacobian.
+        *args : Any
+            Positional arguments for the simulation.
+        **kwargs : Any
+            Keyword arguments for the simulation.
+
+        Returns
+        -------
+        callable
+            A function that evaluates the forward model (and its Jacobian)
+            with the specified arguments.
+
+        """
+        # Build engine once and share it between forward and Jacobian
+        engine, argnums = self._get_func(self._engine, *args, **kwargs)
+
+        if not has_jac:
+            return broadcast(self._get_forward_engine(engine, *args, **kwargs))
+
+        if _is_implemented(self._jacobian_engine):
+            forward_engine = self._get_forward_engine(engine, *args, **kwargs)
+            jac_engine, _ = self._get_func(self._jacobian_engine, *args, **kwargs)
+            vmapped_jac = _vmap(jac_engine, self.chunk_size, self._in_dims)
+
+            def manual_engine(*inputs):
+                return forward_engine(*inputs), vmapped_jac(*inputs)
+
+            return broadcast(manual_engine)
+
+        if self.jac_mode == "auto":
+            vmapped_jac = None
+
+            # Select differentiation mode on first call
+            def auto_jacobian_engine(*inputs):
+                nonlocal vmapped_jac
+                if vmapped_jac is None:
+                    jac_mode = _get_jac_mode(engine, argnums, inputs)
+                    jac_engine = _JAC_MODES[jac_mode](
+                        argnums=argnums, return_output=True
+                    )(engine)
+                    vmapped_jac = _vmap(jac_engine, self.chunk_size, self._in_dims)
+                return vmapped_jac(*inputs)
+
+            return broadcast(auto_jacobian_engine)
+
+        jac_engine = _JAC_MODES[self.jac_mode](argnums=argnums, return_output=True)(
+            engine
+        )
+        vmapped_jac = _vmap(jac_engine, self.chunk_size, self._in_dims)
+        return broadcast(vmapped_jac)
+
     def _forward(self, *args, **kwargs):
         """
         Return a callable for forward computation. Useful for sequence optimization.
@@ -160,14 +345,7 @@ class AbstractModel(ABC):
             A function that evaluates the forward model with the specified arguments.
 
         """
-        engine, _ = self._get_func(self._engine, *args, **kwargs)
-
-        def vmapped_engine(*inputs):
-            vmapped = torch.vmap(engine, chunk_size=self.chunk_size)
-            broadcast_vmapped = broadcast(vmapped)
-            return broadcast_vmapped(*inputs)
-
-        return vmapped_engine
+        return self._compute(False, *args, **kwargs)
 
     def _jacobian(self, *args, **kwargs):
         """
@@ -188,25 +366,34 @@ class AbstractModel(ABC):
         """
         if self.diff is None:
             return None
-        if _is_implemented(self._jacobian_engine):
-            jac_engine, argnums = self._get_func(self._jacobian_engine, *args, **kwargs)
 
-            def jacobian_engine(*inputs):
-                vmapped_jac = torch.vmap(jac_engine, chunk_size=self.chunk_size)
-                broadcast_vmapped_jac = broadcast(vmapped_jac)
-                return broadcast_vmapped_jac(*inputs)
+        # Manual Jacobian engine does not need the forward output
+        if _is_implemented(self._jacobian_engine):
+            jac_engine, _ = self._get_func(self._jacobian_engine, *args, **kwargs)
+            return broadcast(_vmap(jac_engine, self.chunk_size, self._in_dims))
 
-        else:
-            engine, argnums = self._get_func(self._engine, *args, **kwargs)
+        compute_fn = self._compute(True, *args, **kwargs)
 
-            def jacobian_engine(*inputs):
-                jac_engine = jacfwd(argnums=argnums)(engine)
-                vmapped_jac = torch.vmap(jac_engine, chunk_size=self.chunk_size)
-                broadcast_vmapped_jac = broadcast(vmapped_jac)
-                return broadcast_vmapped_jac(*inputs)
+        def jacobian_engine(*inputs):
+            return compute_fn(*inputs)[1]
 
         return jacobian_engine
 
+    def _get_call_fn(self) -> Callable:
+        """
+        Return the callable used by ``__call__``.
+
+        The callable is cached until ``set_properties`` or ``set_sequence`` are called again,
+        so repeated calls skip engine binding and vectorization.
+        """
+        diff = tuple(self.diff) if isinstance(self.diff, list) else self.diff
+        key = (diff, self.chunk_size, self.jac_mode, self.compile, self.use_vmap)
+        if key not in self._call_cache:
+            self._call_cache[key] = self._compute(
+                diff is not None, **self._non_broadcastable_kwargs
+            )
+        return self._call_cache[key]
+
     def __call__(self):
         """
         Calls both forward and jacobian methods, returning output and jacobian for sequence optimization.
@@ -217,46 +404,21 @@ class AbstractModel(ABC):
             A tuple containing the forward output and jacobian output.
 
         """
-        kwargs = {**vars(self.properties), **vars(self.sequence)}
+        # Account for direct assignments to device, properties or sequence
+        self._update_split()
+        broadcastable_kwargs = self._broadcastable_kwargs
 
-        # Get device
-        if self.device is None:
-            # get device from first positional or keyworded argument
-            leading_arg = _get_leading_argument([], kwargs)
-
-            # get array module from leading argument
-            device = _get_device(leading_arg)
-        else:
-            device = self.device
-
-        # Force device
-        for k in kwargs.keys():
-            if isinstance(kwargs[k], torch.Tensor):
-                kwargs[k] = kwargs[k].to(device)
-
-        # Split broadcastable and non-broadcastable params
-        broadcastable_kwargs = {
-            k: v for k, v in kwargs.items() if k in self.broadcastable_params
-        }
-        non_broadcastable_kwargs = {
-            k: v for k, v in kwargs.items() if k not in self.broadcastable_params
-        }
-
-        # Get forward function
-        forward_fn = self._forward(**non_broadcastable_kwargs)
-
-        # If no derivative is requested, run forward with explicit `no_grad()` for performance
+        # If no derivative is requested, run forward with explicit `no_grad()` for performance.
+        # `inference_mode()` is avoided, as its outputs cannot be used in autograd or modified in-place
         if self.diff is None:
+            forward_fn = self._get_call_fn()
             with torch.no_grad():
                 output = forward_fn(*broadcastable_kwargs.values())
             return output
 
-        # Run forward pass
-        output = forward_fn(*broadcastable_kwargs.values())
-
-        # Get derivative and run
-        jacobian_fn = self._jacobian(**non_broadcastable_kwargs)
-        jacobian_output = jacobian_fn(*broadcastable_kwargs.values())
+        # Run forward pass and get derivative at once
+        compute_fn = self._get_call_fn()
+        output, jacobian_output = compute_fn(*broadcastable_kwargs.values())
 
         return output, jacobian_output
 
@@ -275,11 +437,8 @@ class AbstractModel(ABC):
             Forward method.
 
         """
-        _kwargs = {**vars(self.properties), **vars(self.sequence)}
-
-        non_broadcastable_kwargs = {
-            k: v for k, v in _kwargs.items() if k not in self.broadcastable_params
-        }
+        self._update_split()
+        non_broadcastable_kwargs = self._non_broadcastable_kwargs
 
         _forward_fn = self._forward(**non_broadcastable_kwargs)
 
@@ -297,27 +456,12 @@ class AbstractModel(ABC):
             ]
         )
 
-        def forward_fn(*args, **kwargs):
-            # Get number of arguments
-            n_args = len(args)
-
-            # Create a dictionary of keyword arguments and their default values
-            _kwargs = {}
-            for k, v in forward_sig.parameters.items():
-                if v.default is not inspect.Parameter.empty:
-                    _kwargs[k] = v.default
-                else:
-                    _kwargs[k] = None
-
-            # Merge the default keyword arguments with the provided kwargs
-            for k in kwargs.keys():
-                _kwargs[k] = kwargs[k]
+        # Get (cached) default values of the engine parameters
+        parameter_names = tuple(self.broadcastable_params)
+        _, default_args = _get_signature_info(self._engine)
 
-            # Replace args
-            _args = list(_kwargs.values())
-            _args = list(args) + _args[n_args:]
-
-            return _forward_fn(*_args)
+        def forward_fn(*args, **kwargs):
+            return _forward_fn(*_get_args(parameter_names, default_args, args, kwargs))
 
         # Bind the new signature to the function
         forward_fn.__signature__ = forward_sig
@@ -342,11 +486,8 @@ class AbstractModel(ABC):
             Jacobian method.
 
         """
-        kwargs = {**vars(self.properties), **vars(self.sequence)}
-
-        non_broadcastable_kwargs = {
-            k: v for k, v in kwargs.items() if k not in self.broadcastable_params
-        }
+        self._update_split()
+        non_broadcastable_kwargs = self._non_broadcastable_kwargs
 
         _jacobian_fn = self._jacobian(**non_broadcastable_kwargs)
 
@@ -364,27 +505,12 @@ class AbstractModel(ABC):
             ]
         )
 
-        def jacobian_fn(*args, **kwargs):
-            # Get number of arguments
-            n_args = len(args)
-
-            # Create a dictionary of keyword arguments and their default values
-            _kwargs = {}
-            for k, v in jacobian_sig.parameters.items():
-                if v.default is not inspect.Parameter.empty:
-                    _kwargs[k] = v.default
-                else:
-                    _kwargs[k] = None
-
-            # Merge the default keyword arguments with the provided kwargs
-            for k in kwargs.keys():
-                _kwargs[k] = kwargs[k]
-
-            # Replace args
-            _args = list(_kwargs.values())
-            _args = list(args) + _args[n_args:]
+        # Get (cached) default values of the engine parameters
+        parameter_names = tuple(self.broadcastable_params)
+        _, default_args = _get_signature_info(self._engine)
 
-            return _jacobian_fn(*_args)
+        def jacobian_fn(*args, **kwargs):
+            return _jacobian_fn(*_get_args(parameter_names, default_args, args, kwargs))
 
         # Bind the new signature to the function
         jacobian_fn.__signature__ = jacobian_sig
@@ -396,53 +522,206 @@ class AbstractModel(ABC):
 
 
 # %% TODO: move
-def _is_implemented(method) -> bool:
-    """Check if the method is implemented or raises NotImplementedError."""
-    try:
-        # Check if the method raises NotImplementedError or has no implementation
-        source_code = inspect.getsource(method)
-        return (
-            "raise NotImplementedError" not in source_code and "pass" not in source_code
-        )
-    except AttributeError:
-        return False
+_JAC_MODES = {"fwd": jacfwd, "rev": jacrev}
 
 
-def _get_args(func, args, kwargs):
-    """Convert input args/kwargs mix to a list of positional arguments.
+@lru_cache(maxsize=None)
+def _get_signature_info(func) -> tuple[tuple[str, ...], dict[str, Any]]:
+    """
+    Get parameter names and default values of a function.
 
-    This automatically fills missing kwargs with default values.
+    Result is cached, as the signature of the model engines never changes.
+    Missing default values are replaced by ``None``. The returned dictionary
+    is shared between calls and must not be modified in-place.
+    """
+    return _fast_signature(func)
+
+
+def _fast_signature(func) -> tuple[tuple[str, ...], dict[str, Any]]:
+    """
+    Get parameter names and default values of a function.
+
+    For plain Python functions with positional-or-keyword parameters only,
+    these are read directly from the code object. Other callables
+    (e.g., methods, decorated functions, signatures with variadic or keyword-only
+    parameters) fall back to ``inspect.signature``.
+    Missing default values are replaced by ``None``.
     """
+    if _has_simple_signature(func):
+        code = func.__code__
+        parameter_names = code.co_varnames[: code.co_argcount]
+        defaults = func.__defaults__ or ()
+        n_required = len(parameter_names) - len(defaults)
+        default_args = dict.fromkeys(parameter_names[:n_required])
+        default_args.update(zip(parameter_names[n_required:], defaults))
+        return parameter_names, default_args
+
     signature = inspect.signature(func)
 
-    # Get number of arguments
-    n_args = len(args)
+    # Get parameter names
+    parameter_names = tuple(signature.parameters.keys())
 
-    # Create a dictionary of keyword arguments and their default values
-    _kwargs = {}
+    # Extract default values for all parameters
+    default_args = {}
     for k, v in signature.parameters.items():
         if v.default is not inspect.Parameter.empty:
-            _kwargs[k] = v.default
+            default_args[k] = v.default
         else:
-            _kwargs[k] = None
+            default_args[k] = None
+
+    return parameter_names, default_args
 
-    # Merge the default keyword arguments with the provided kwargs
-    for k in kwargs.keys():
-        _kwargs[k] = kwargs[k]
 
-    # Replace args
-    _args = list(_kwargs.values())
+def _has_simple_signature(func) -> bool:
+    """Check if function signature can be read from its code object."""
+    if not isinstance(func, FunctionType):
+        return False
+    if hasattr(func, "__wrapped__") or hasattr(func, "__signature__"):
+        return False
+    code = func.__code__
+    return not (
+        code.co_kwonlyargcount
+        or code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS)
+    )
 
-    return list(args) + _args[n_args:]
 
+def _split_after(setter):
+    """Split model parameters after calling a ``set_properties`` / ``set_sequence`` method."""
 
-def _get_argnums(diff, ARGS):  # noqa
-    """Helper function to get argument indices for differentiation."""
-    ARGMAP = dict(zip(ARGS, list(range(len(ARGS)))))
+    @wraps(setter)
+    def wrapper(self, *args, **kwargs):
+        setter(self, *args, **kwargs)
+        self._split_kwargs()
+
+    return wrapper
+
+
+def _is_same_state(state, other) -> bool:
+    """Check if two parameter split states refer to the same device and parameter objects."""
+    if len(state) != len(other) or state[0] != other[0]:
+        return False
+    return all(
+        k == other_k and v is other_v
+        for (k, v), (other_k, other_v) in zip(state[1:], other[1:])
+    )
+
+
+def _is_implemented(method) -> bool:
+    """Check if the method is implemented or is a ``not_implemented`` placeholder."""
+    return not getattr(method, "_not_implemented", False)
+
+
+def _get_args(parameter_names, default_args, args, kwargs):
+    """Convert input args/kwargs mix to a list of positional arguments.
+
+    This automatically fills missing kwargs with default values.
+    """
+    # Resolve provided kwargs first, then default values, without copying defaults
+    _kwargs = ChainMap(kwargs, default_args)
+
+    return list(args) + [_kwargs[k] for k in parameter_names[len(args) :]]
+
+
+def _vmap(func, chunk_size, in_dims=0):
+    """
+    Vectorize function over the leading axis of the inputs.
+
+    ``in_dims`` is forwarded to ``torch.func.vmap``; passing an explicit
+    per-argument tuple skips its normalization on every call.
+    """
+    return _chunk(torch.func.vmap(func, in_dims=in_dims), chunk_size)
+
+
+def _chunk(func, chunk_size):
+    """
+    Evaluate batched function in chunks of ``chunk_size`` along the leading axis of the inputs.
+
+    Chunk outputs are written to preallocated tensors rather than stored
+    and concatenated at the end, to limit peak memory usage.
+    """
+    if chunk_size is None:
+        return func
+
+    def wrapper(*args):
+        nbatches = args[0].shape[0]
+        if nbatches <= chunk_size:
+            return func(*args)
+
+        output = None
+        for start in range(0, nbatches, chunk_size):
+            stop = start + chunk_size
+            chunk = func(*[arg[start:stop] for arg in args])
+            if not isinstance(chunk, tuple):
+                chunk = (chunk,)
+
+            # Allocate output on first chunk
+            if output is None:
+                output = [
+                    torch.empty(
+                        (nbatches, *out.shape[1:]), dtype=out.dtype, device=out.device
+                    )
+                    for out in chunk
+                ]
+            for n in range(len(chunk)):
+                output[n][start:stop] = chunk[n]
+
+            # Release chunk output before computing the next one
+            del chunk
+
+        if len(output) == 1:
+            return output[0]
+        return tuple(output)
+
+    return wrapper
+
+
+def _complex_output(func):
+    """Convert ``(real, imag)`` tuple output to a complex tensor."""
+
+    def wrapper(*args):
+        output = func(*args)
+        if isinstance(output, tuple):
+            return torch.complex(*output)
+        return output
 
+    return wrapper
+
+
+def _expand_dims(func, ndim):
+    """Append ``ndim`` singleton axes to the inputs, so that they broadcast with sequence axes."""
+
+    def wrapper(*args):
+        return func(*[arg.reshape(*arg.shape, *(1,) * ndim) for arg in args])
+
+    return wrapper
+
+
+def _get_max_ndim(args):
+    """Get maximum number of dimensions of the tensors in the input sequence."""
+    return max([arg.ndim for arg in args if isinstance(arg, torch.Tensor)], default=0)
+
+
+def _get_jac_mode(engine, argnums, inputs) -> str:
+    """Select Jacobian mode comparing number of inputs and outputs for a single sample."""
+    sample = [x[0] for x in inputs]
+    if isinstance(argnums, int):
+        argnums = (argnums,)
+    in_numel = sum([sample[n].numel() for n in argnums])
+    output = engine(*sample)
+    if isinstance(output, tuple):
+        out_numel = sum([out.numel() for out in output])
+    else:
+        out_numel = 2 * output.numel()  # real and imaginary parts
+    if in_numel <= out_numel:
+        return "fwd"
+    return "rev"
+
+
+def _get_argnums(diff, argmap):
+    """Helper function to get argument indices for differentiation."""
     if isinstance(diff, str):
-        return ARGMAP[diff]
+        return argmap[diff]
     elif isinstance(diff, (tuple, list)):
-        return tuple([ARGMAP[d] for d in diff])
+        return tuple([argmap[d] for d in diff])
     else:
         raise ValueError(f"Unsupported diff type: {diff}")
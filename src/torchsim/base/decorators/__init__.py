@@ -5,5 +5,16 @@ __all__ = []
 from ._autocast import autocast  # noqa
 from ._broadcast import broadcast, broadcast_arguments  # noqa
 from ._jacfwd import jacfwd  # noqa
+from ._jacrev import jacrev  # noqa
+from ._not_implemented import not_implemented  # noqa
 
-__all__.extend(["autocast", "broadcast", "broadcast_arguments", "jacfwd"])
+__all__.extend(
+    [
+        "autocast",
+        "broadcast",
+        "broadcast_arguments",
+        "jacfwd",
+        "jacrev",
+        "not_implemented",
+    ]
+)
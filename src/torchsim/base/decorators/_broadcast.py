@@ -22,9 +22,9 @@ def broadcast(func: Callable) -> Callable:
 
         # run function
         output = func(*args)
-        if torch.isreal(output).all():
-            output = output.real
-        return output.reshape(*shape, *output.shape[1:]).squeeze()
+        if isinstance(output, tuple):
+            return tuple([_reshape_output(out, shape) for out in output])
+        return _reshape_output(output, shape)
 
     return wrapper
 
@@ -64,6 +64,13 @@ def _find_first_nonscalar_shape(batched_args):  # noqa
     return shape
 
 
+def _reshape_output(output, shape):
+    """Reshape batched output to input shape, removing imaginary part if zero."""
+    if torch.isreal(output).all():
+        output = output.real
+    return output.reshape(*shape, *output.shape[1:]).squeeze()
+
+
 def _get_tensor_args_kwargs(*args, **kwargs):
     items = []
     kwitems = {}
@@ -8,7 +8,7 @@ from typing import Callable, Optional
 import torch
 
 
-def jacfwd(argnums: tuple[int]) -> Callable:
+def jacfwd(argnums: tuple[int], return_output: bool = False) -> Callable:
     """
     Decorator to compute the Jacobian of a function with complex-valued outputs.
 
@@ -16,6 +16,10 @@ def jacfwd(argnums: tuple[int]) -> Callable:
     ----------
     argnum : tuple[int]
         The argument indexes to compute the Jacobian with respect to.
+    return_output : bool, optional
+        If ``True``, return the function output along with its Jacobian.
+        The output is obtained from the same pass used to compute the Jacobian.
+        The default is ``False``.
 
     Returns
     -------
@@ -36,12 +40,18 @@ def jacfwd(argnums: tuple[int]) -> Callable:
             """
 
             # Define a wrapper function to evaluate real-imag split output
+            # and return the original output as auxiliary
             def wrapped_fn(*wrapped_args):
-                return _split_real_imag(fn(*wrapped_args, **kwargs))
+                output = fn(*wrapped_args, **kwargs)
+                return _split_real_imag(output), output
 
             # Compute the Jacobian using jacfwd
-            jacobian = torch.func.jacfwd(wrapped_fn, argnums=argnums)(*args)
+            jacobian, output = torch.func.jacfwd(
+                wrapped_fn, argnums=argnums, has_aux=True
+            )(*args)
 
+            if return_output:
+                return _to_complex(output), _combine_real_imag(jacobian)
             return _combine_real_imag(jacobian)
 
         return wrapper
@@ -50,8 +60,12 @@ def jacfwd(argnums: tuple[int]) -> Callable:
 
 
 # %% subroutines
-def _split_real_imag(tensor: torch.Tensor) -> torch.Tensor:
-    """Split complex tensor into real and imaginary components."""
+def _split_real_imag(
+    tensor: torch.Tensor | tuple[torch.Tensor, torch.Tensor],
+) -> torch.Tensor:
+    """Split complex tensor (or stack ``(real, imag)`` tuple) into real and imaginary components."""
+    if isinstance(tensor, tuple):
+        return torch.stack(tensor, dim=0)
     if torch.is_complex(tensor):
         return torch.stack([tensor.real, tensor.imag], dim=0)
     else:
@@ -66,3 +80,12 @@ def _combine_real_imag(split_tensor: torch.Tensor) -> torch.Tensor:
     else:
         output = split_tensor[..., 0, :] + 1j * split_tensor[..., 1, :]
     return output
+
+
+def _to_complex(
+    tensor: torch.Tensor | tuple[torch.Tensor, torch.Tensor],
+) -> torch.Tensor:
+    """Assemble complex tensor from ``(real, imag)`` tuple."""
+    if isinstance(tensor, tuple):
+        return torch.complex(*tensor)
+    return tensor
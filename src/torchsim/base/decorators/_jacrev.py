@@ -0,0 +1,64 @@
+"""Wrapper for complex reverse jacobian."""
+
+__all__ = ["jacrev"]
+
+from functools import wraps
+
+from typing import Callable, Optional
+import torch
+
+from ._jacfwd import _split_real_imag, _combine_real_imag, _to_complex
+
+
+def jacrev(argnums: tuple[int], return_output: bool = False) -> Callable:
+    """
+    Decorator to compute the Jacobian of a function with complex-valued outputs.
+
+    Uses reverse-mode autodiff, which is faster than :func:`jacfwd`
+    when the number of inputs exceeds the number of outputs.
+
+    Parameters
+    ----------
+    argnum : tuple[int]
+        The argument indexes to compute the Jacobian with respect to.
+    return_output : bool, optional
+        If ``True``, return the function output along with its Jacobian.
+        The output is obtained from the same pass used to compute the Jacobian.
+        The default is ``False``.
+
+    Returns
+    -------
+    Callable
+        Decorated function that computes the Jacobian with appropriate handling of complex outputs.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        @wraps(fn)
+        def wrapper(*args, **kwargs) -> tuple[torch.Tensor, Optional[torch.Tensor]]:
+            """
+            Wrapper function for differentiation.
+
+            Returns
+            -------
+            Tuple[torch.Tensor, Optional[torch.Tensor]]
+                Original function output and its Jacobian.
+            """
+
+            # Define a wrapper function to evaluate real-imag split output
+            # and return the original output as auxiliary
+            def wrapped_fn(*wrapped_args):
+                output = fn(*wrapped_args, **kwargs)
+                return _split_real_imag(output), output
+
+            # Compute the Jacobian using jacrev
+            jacobian, output = torch.func.jacrev(
+                wrapped_fn, argnums=argnums, has_aux=True
+            )(*args)
+
+            if return_output:
+                return _to_complex(output), _combine_real_imag(jacobian)
+            return _combine_real_imag(jacobian)
+
+        return wrapper
+
+    return decorator
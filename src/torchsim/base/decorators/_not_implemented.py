@@ -0,0 +1,16 @@
+"""Placeholder marker for optional methods."""
+
+__all__ = ["not_implemented"]
+
+from typing import Callable
+
+
+def not_implemented(func: Callable) -> Callable:
+    """
+    Mark a method as a not implemented placeholder.
+
+    Subclasses overriding the method do not carry the marker,
+    so implementation can be checked without inspecting the source code.
+    """
+    func._not_implemented = True
+    return func
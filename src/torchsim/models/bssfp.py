@@ -42,6 +42,8 @@ class bSSFPModel(AbstractModel):
 
     """
 
+    use_vmap = False
+
     @autocast
     def set_properties(
         self,
@@ -118,20 +120,25 @@ class bSSFPModel(AbstractModel):
         chemshift: float | npt.ArrayLike = 0.0,
         phase_inc: float = 180.0,
     ):
-        # Prepare relaxation parameters
-        R1, R2 = 1e3 / T1, 1e3 / T2
-
+        # Prepare relaxation parameters.
+        # Zero relaxation times are masked to avoid divide-by-zero
+        # (the corresponding relaxation factors are set to 0).
+        mask1, mask2 = T1 > 0, T2 > 0
+        R1 = 1e3 / torch.where(mask1, T1, 1.0)
+        R2 = 1e3 / torch.where(mask2, T2, 1.0)
+
+        # Prepare off resonance.
         # We are assuming Freeman-Hill convention for off-resonance map,
         # so we need to negate to make use with this Ernst-Anderson-based implementation from Hoff
-        B0 = -B0
+        df = 2 * torch.pi * (chemshift - B0)
 
-        # Prepare off resonance
-        df = 2 * torch.pi * (B0 + chemshift)
+        # Compute relaxation factors
+        E1 = torch.where(mask1, torch.exp(-R1 * TR), 0.0)
+        E2 = torch.where(mask2, torch.exp(-R2 * TE), 0.0)
 
-        # Divide-by-zero risk with PyTorch's nan_to_num
-        E1 = torch.exp(-R1 * TR)
-        E2 = torch.exp(-R2 * TE)
-        Phi = torch.exp(1j * df * TE)
+        # Phase factor for readout at TE, kept as real and imaginary parts
+        cphi = torch.cos(df * TE)
+        sphi = torch.sin(df * TE)
 
         # Precompute theta and some cos, sin
         theta = df * TR + phase_inc
@@ -144,12 +151,11 @@ class bSSFPModel(AbstractModel):
         den = (1 - E1 * ca) * (1 - E2 * ct) - (E2 * (E1 - ca)) * (E2 - ct)
         Mx = -1 * M0 * ((1 - E1) * E2 * sa * st) / den
         My = M0 * ((1 - E1) * sa) * (1 - E2 * ct) / den
-        Mxy = Mx + 1j * My
 
         # Add decay
-        signal = Mxy * E2
+        Mx = Mx * E2
+        My = My * E2
 
         # Add additional phase factor for readout at TE.
-        signal = signal * Phi
-
-        return signal
+        # Signal is returned as (real, imag) to avoid complex arithmetic.
+        return Mx * cphi - My * sphi, Mx * sphi + My * cphi
@@ -1,5 +1,6 @@
 """Test abstract model."""
 
+import pytest
 import torch
 
 from torchsim.base import AbstractModel  # Update with actual path
@@ -18,6 +19,13 @@ class MyModel(AbstractModel):
         return torch.tensor([1.0, 2.0, 3.0])
 
 
+# Mock subclass with an input-dependent engine
+class MyLinearModel(MyModel):
+    @staticmethod
+    def _engine(param):
+        return param * torch.tensor([1.0, 2.0, 3.0])
+
+
 # Test initialization and attribute assignment
 def test_initialization():
     model = MyModel(chunk_size=10, device="cuda", diff="param")
@@ -39,6 +47,26 @@ def test_forward():
     assert isinstance(output, torch.Tensor)  # Check that output is a tensor
 
 
+# Test forward function fills missing arguments with engine defaults
+def test_forward_defaults():
+    class MyDefaultModel(MyModel):
+        def set_properties(self, param, offset=1.0):
+            self.properties.param = param
+            self.properties.offset = offset
+
+        @staticmethod
+        def _engine(param, offset=1.0):
+            return param * torch.tensor([1.0, 2.0, 3.0]) + offset
+
+    model = MyDefaultModel()
+    forward_fn = model.forward()
+
+    expected = torch.tensor([3.0, 5.0, 7.0])
+    assert torch.allclose(forward_fn(2.0).real, expected)
+    assert torch.allclose(forward_fn(param=2.0).real, expected)
+    assert torch.allclose(forward_fn(2.0, offset=0.0).real, expected - 1.0)
+
+
 # Test jacobian function
 def test_jacobian():
     model = MyModel(chunk_size=10, diff="param")
@@ -60,3 +88,127 @@ def test_call():
     # Test that the __call__ method returns both outputs
     assert isinstance(output, torch.Tensor)
     assert isinstance(jacobian_output, torch.Tensor)
+
+
+# Test forward and reverse mode jacobian agree
+def test_jacobian_modes():
+    jacobian_outputs = []
+    for jac_mode in ("auto", "fwd", "rev"):
+        model = MyLinearModel(diff="param", jac_mode=jac_mode)
+        model.set_properties(torch.tensor([1.0, 2.0]))
+        _, jacobian_output = model()
+        jacobian_outputs.append(jacobian_output)
+
+    for jacobian_output in jacobian_outputs:
+        assert torch.allclose(jacobian_output.real, torch.tensor([1.0, 2.0, 3.0]))
+
+
+# Test manual jacobian engine is used without evaluating the forward engine
+def test_manual_jacobian():
+    calls = {"engine": 0, "jacobian_engine": 0}
+
+    class MyManualModel(MyModel):
+        @staticmethod
+        def _engine(param):
+            calls["engine"] += 1
+            return param * torch.tensor([1.0, 2.0, 3.0])
+
+        @staticmethod
+        def _jacobian_engine(param):
+            calls["jacobian_engine"] += 1
+            return torch.tensor([1.0, 2.0, 3.0])
+
+    model = MyManualModel(diff="param")
+    jacobian_output = model.jacobian()(torch.tensor([1.0, 2.0]))
+
+    assert torch.allclose(jacobian_output, torch.tensor([1.0, 2.0, 3.0]))
+    assert calls == {"engine": 0, "jacobian_engine": 1}
+
+
+# Test invalid jacobian mode is rejected at construction
+def test_invalid_jac_mode():
+    with pytest.raises(ValueError):
+        MyLinearModel(diff="param", jac_mode="forward")
+
+
+# Test chunked computation matches unchunked one
+def test_chunk_size():
+    outputs = []
+    for chunk_size in (None, 2):
+        model = MyLinearModel(chunk_size=chunk_size, diff="param")
+        model.set_properties(torch.arange(5.0))
+        outputs.append(model())
+
+    assert torch.allclose(outputs[0][0], outputs[1][0])
+    assert torch.allclose(outputs[0][1], outputs[1][1])
+
+
+# Test native broadcasting path matches vectorized one
+def test_use_vmap():
+    class MyScaledModel(MyModel):
+        def set_sequence(self, scale):
+            self.sequence.scale = scale
+
+        @staticmethod
+        def _engine(param, scale):
+            return param * scale
+
+    class MyBroadcastModel(MyScaledModel):
+        use_vmap = False
+
+    outputs = []
+    for model_cls, chunk_size in (
+        (MyScaledModel, None),
+        (MyBroadcastModel, None),
+        (MyBroadcastModel, 2),
+    ):
+        model = model_cls(chunk_size=chunk_size)
+        model.set_properties(torch.arange(5.0))
+        model.set_sequence(torch.tensor([1.0, 2.0, 3.0]))
+        outputs.append(model())
+
+    for output in outputs[1:]:
+        assert torch.allclose(output, outputs[0])
+
+
+# Test compiled forward matches eager one and does not recompile for each batch size
+def test_compile():
+    unique_graphs = torch._dynamo.utils.counters["stats"]["unique_graphs"]
+
+    for nbatches in range(1, 11):
+        model = MyLinearModel()
+        model.set_properties(torch.arange(float(nbatches)))
+        output = model()
+
+        compiled_model = MyLinearModel(compile=True)
+        compiled_model.set_properties(torch.arange(float(nbatches)))
+        assert torch.allclose(compiled_model(), output)
+        assert len(compiled_model._call_cache) == 1
+
+    assert torch._dynamo.utils.counters["stats"]["unique_graphs"] - unique_graphs <= 2
+
+
+# Test repeated calls reuse cached callable until parameters change
+def test_call_cache():
+    model = MyLinearModel()
+    model.set_properties(torch.tensor([1.0]))
+    output = model()
+    assert len(model._call_cache) == 1
+    assert torch.allclose(model(), output)
+
+    model.set_properties(torch.tensor([2.0]))
+    assert len(model._call_cache) == 0
+    assert torch.allclose(model(), 2 * output)
+
+
+# Test direct assignment of parameters is picked up at call time
+def test_direct_assignment():
+    model = MyLinearModel()
+    model.set_properties(torch.tensor([1.0]))
+    output = model()
+
+    model.properties.param = torch.tensor([2.0])
+    assert torch.allclose(model(), 2 * output)
+
+    model.device = "cpu"
+    assert torch.allclose(model(), 2 * output)
@@ -3,7 +3,10 @@
 from pytest import fixture
 
 import numpy as np
+import torch
+
 from torchsim import bssfp_sim
+from torchsim.models import bSSFPModel
 
 
 @fixture
@@ -53,3 +56,45 @@ def test_multiple_gradient(flip):
         diff=("T1", "T2"),
     )
     assert grad.shape == (3, 2, 100)
+
+
+def test_forward_autograd(flip):
+    sig = bssfp_sim(flip, TE=2.0, TR=10.0, T1=(500.0, 1000.0), T2=100.0)
+    weight = torch.ones(2, dtype=sig.dtype, requires_grad=True)
+    (weight @ sig).abs().sum().backward()
+    assert weight.grad is not None
+
+    sig.mul_(2)
+
+
+def test_zero_relaxation(flip):
+    sig, grad = bssfp_sim(
+        flip,
+        TE=2.0,
+        TR=10.0,
+        T1=(0.0, 1000.0),
+        T2=(100.0, 0.0),
+        diff=("T1", "T2"),
+    )
+    assert torch.isfinite(sig).all()
+    assert torch.isfinite(grad).all()
+
+
+def test_chunked_forward(flip):
+    T1 = np.linspace(200.0, 1000.0, 7)
+    sig = bssfp_sim(flip, TE=2.0, TR=10.0, T1=T1, T2=100.0)
+    chunked_sig = bssfp_sim(flip, TE=2.0, TR=10.0, T1=T1, T2=100.0, chunk_size=3)
+    assert torch.allclose(sig, chunked_sig)
+
+
+def test_vmap_forward(flip):
+    class bSSFPVmapModel(bSSFPModel):
+        use_vmap = True
+
+    sig = []
+    for model in (bSSFPModel(), bSSFPVmapModel()):
+        model.set_properties(T1=(200, 500, 1000.0), T2=100.0, B0=10.0)
+        model.set_sequence(flip=flip, TR=10.0, TE=2.0)
+        sig.append(model())
+
+    assert torch.allclose(sig[0], sig[1])
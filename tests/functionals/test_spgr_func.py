@@ -3,6 +3,8 @@
 from pytest import fixture
 
 import numpy as np
+import torch
+
 from torchsim import spgr_sim
 
 
@@ -55,3 +57,16 @@ def test_multiple_gradient(flip):
         diff=("T1", "T2star"),
     )
     assert grad.shape == (3, 2, 100)
+
+
+def test_zero_relaxation(flip):
+    sig, grad = spgr_sim(
+        flip,
+        TE=2.0,
+        TR=10.0,
+        T1=(0.0, 1000.0),
+        T2star=(100.0, 0.0),
+        diff=("T1", "T2star"),
+    )
+    assert torch.isfinite(sig).all()
+    assert torch.isfinite(grad).all()